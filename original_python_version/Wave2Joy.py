@@ -13,15 +13,41 @@ Usage:
 """
 
 import pygame
+import os
 import sys
 import time
+import functools
 import threading
 import math
 import random
 import json
-from collections import deque
+import atexit
+import contextlib
+import collections.abc
+import hashlib
+import mmap
 from typing import Tuple, Optional, Dict
 
+# orjson parses and serializes several times faster than the stdlib json
+# module; the preset code falls back to json when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# On Windows the default 15.6 ms timer quantum rounds every sleep in the
+# 100 Hz session loop up to a full quantum, wrecking the update rate. winmm's
+# timeBeginPeriod(1) drops it to 1 ms; it is requested only while a session
+# runs so the system-wide interrupt-rate cost is scoped to when it matters.
+if sys.platform == 'win32':
+    import ctypes
+    try:
+        _winmm = ctypes.WinDLL('winmm')
+    except OSError:
+        _winmm = None
+else:
+    _winmm = None
+
 # ============================================================================
 # GLOBAL CONSTANTS
 # ============================================================================
@@ -33,9 +59,16 @@ CROSSFADE_MS = 100
 MAX_INTENSITY = 255
 STOCHASTIC_START_INTENSITY_MULTIPLIER = 0.30
 
+# Second-based forms of the timing constants above, precomputed once so the
+# 100 Hz update loop never repeats the ms->s division per tick.
+STARTUP_RAMP_S = STARTUP_RAMP_MS / 1000.0
+FADEOUT_S = FADEOUT_MS / 1000.0
+CROSSFADE_S = CROSSFADE_MS / 1000.0
+
 # Constants for the new pulse modes
 CONSTANT_PULSE_BUZZ_MS = 200
 CONSTANT_PULSE_GAP_MS = 100
+CONSTANT_PULSE_TOTAL_MS = CONSTANT_PULSE_BUZZ_MS + CONSTANT_PULSE_GAP_MS
 
 # GUI Constants
 WINDOW_WIDTH = 1400
@@ -63,10 +96,81 @@ def ease_in_quad(t: float) -> float:
     """Quadratic ease-in curve (t*t) for a smoother ramp."""
     return t * t
 
+# Sine lookup table for the per-tick oscillators. A 4096-entry table keeps the
+# error below 1e-3, which is invisible on an 8-bit rumble motor, and a table
+# load is several times cheaper than math.sin at 100 Hz.
+_SIN_LUT_SIZE = 4096
+_SIN_MASK = _SIN_LUT_SIZE - 1
+_SIN_SCALE = _SIN_LUT_SIZE / (2 * math.pi)
+_SIN_QUARTER = _SIN_LUT_SIZE // 4  # +pi/2 expressed as a table-index offset
+_SIN_HALF = _SIN_LUT_SIZE // 2     # +pi expressed as a table-index offset
+_SIN_LUT = tuple(math.sin(2 * math.pi * i / _SIN_LUT_SIZE) for i in range(_SIN_LUT_SIZE))
+
+def sin_lut(phase: float) -> float:
+    """Table-based approximation of math.sin(phase) for phase >= 0."""
+    return _SIN_LUT[int(phase * _SIN_SCALE) & _SIN_MASK]
+
+def _build_beta23_lut(size: int = 4096) -> Tuple[float, ...]:
+    """Invert the Beta(2, 3) CDF F(x) = 6x^2 - 8x^3 + 3x^4 by bisection."""
+    lut = []
+    for i in range(size):
+        q = (i + 0.5) / size
+        lo, hi = 0.0, 1.0
+        for _ in range(30):
+            mid = (lo + hi) / 2.0
+            if 6 * mid**2 - 8 * mid**3 + 3 * mid**4 < q:
+                lo = mid
+            else:
+                hi = mid
+        lut.append((lo + hi) / 2.0)
+    return tuple(lut)
+
+# Inverse CDF of Beta(2, 3) at 4096 quantile midpoints. Gap generation draws
+# from this distribution; indexing the table with 12 random bits replaces
+# random.betavariate, which needs two gamma samples per draw.
+_BETA23_LUT = _build_beta23_lut()
+
 # ============================================================================
 # GUI COMPONENTS
 # ============================================================================
 
+# Rendered-text cache shared by all widgets. font.render is the most expensive
+# pygame call in a typical frame and widget text rarely changes, so rasterize
+# each unique (font, text, color) once and reuse the surface on later redraws.
+_text_cache = {}
+
+def render_text(font, text, color):
+    """Return a cached surface for text rendered with font in color."""
+    key = (id(font), text, color)
+    surf = _text_cache.get(key)
+    if surf is None:
+        if len(_text_cache) > 512:
+            _text_cache.clear()
+        # Match the display's pixel format so later blits are plain copies
+        # instead of per-pixel conversions.
+        surf = font.render(text, True, color).convert_alpha()
+        _text_cache[key] = surf
+    return surf
+
+# Rounded rects are the slowest pygame.draw primitive (anti-aliased corners),
+# and every widget draws two per frame. Rasterize each (size, colors, radius)
+# combination once and blit the cached surface on later frames.
+_panel_cache = {}
+
+def panel_surface(size, color, border_color=None, border_width=0, radius=5):
+    """Return a cached surface holding a rounded rect with optional border."""
+    key = (size, color, border_color, border_width, radius)
+    surf = _panel_cache.get(key)
+    if surf is None:
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        rect = surf.get_rect()
+        pygame.draw.rect(surf, color, rect, border_radius=radius)
+        if border_color is not None:
+            pygame.draw.rect(surf, border_color, rect, border_width, border_radius=radius)
+        surf = surf.convert_alpha()
+        _panel_cache[key] = surf
+    return surf
+
 class Button:
     """Simple button widget."""
     def __init__(self, x, y, width, height, text, callback=None):
@@ -80,10 +184,9 @@ class Button:
         color = BUTTON_HOVER if self.hovered and self.enabled else BUTTON_COLOR
         if not self.enabled:
             color = (40, 40, 50)
-        pygame.draw.rect(screen, color, self.rect, border_radius=5)
-        pygame.draw.rect(screen, ACCENT_COLOR, self.rect, 2, border_radius=5)
-        
-        text_surf = font.render(self.text, True, TEXT_COLOR if self.enabled else (100, 100, 110))
+        screen.blit(panel_surface(self.rect.size, color, ACCENT_COLOR, 2, 5), self.rect)
+
+        text_surf = render_text(font, self.text, TEXT_COLOR if self.enabled else (100, 100, 110))
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
         
@@ -120,20 +223,22 @@ class Slider:
             display_value = f"{int(self.value)}"
         
         label_text = f"{self.label}: {display_value}"
-        label_surf = font_small.render(label_text, True, TEXT_COLOR)
+        label_surf = render_text(font_small, label_text, TEXT_COLOR)
         
         self.label_rect = label_surf.get_rect(topleft=(self.rect.x, self.rect.y - 20))
         screen.blit(label_surf, self.label_rect)
         
         # Track
-        pygame.draw.rect(screen, SLIDER_COLOR, self.rect, border_radius=3)
-        
-        # Fill
+        screen.blit(panel_surface(self.rect.size, SLIDER_COLOR, radius=3), self.rect)
+
+        # Fill: blit the matching slice of a cached full-width bar
         progress = (self.value - self.min_val) / (self.max_val - self.min_val)
-        fill_rect = pygame.Rect(self.rect.x, self.rect.y, 
-                               int(self.rect.width * progress), self.rect.height)
-        pygame.draw.rect(screen, ACCENT_COLOR, fill_rect, border_radius=3)
-        
+        fill_width = int(self.rect.width * progress)
+        if fill_width > 0:
+            fill_surf = panel_surface(self.rect.size, ACCENT_COLOR, radius=3)
+            screen.blit(fill_surf, self.rect,
+                        area=pygame.Rect(0, 0, fill_width, self.rect.height))
+
         # Handle
         handle_x = self.rect.x + int(self.rect.width * progress)
         pygame.draw.circle(screen, TEXT_COLOR, (handle_x, self.rect.centery), 8)
@@ -168,23 +273,22 @@ class Dropdown:
         
     def draw(self, screen, font_small):
         # Label
-        label_surf = font_small.render(self.label, True, TEXT_COLOR)
+        label_surf = render_text(font_small, self.label, TEXT_COLOR)
         self.label_rect = label_surf.get_rect(topleft=(self.rect.x, self.rect.y - 20))
         screen.blit(label_surf, self.label_rect)
-        
+
         # Main box
-        pygame.draw.rect(screen, PANEL_COLOR, self.rect, border_radius=3)
-        pygame.draw.rect(screen, ACCENT_COLOR, self.rect, 2, border_radius=3)
-        
+        screen.blit(panel_surface(self.rect.size, PANEL_COLOR, ACCENT_COLOR, 2, 3), self.rect)
+
         # Selected text
-        text_surf = font_small.render(self.options[self.selected_index], True, TEXT_COLOR)
+        text_surf = render_text(font_small, self.options[self.selected_index], TEXT_COLOR)
         text_rect = text_surf.get_rect(centery=self.rect.centery)
         text_rect.x = self.rect.x + 10
         screen.blit(text_surf, text_rect)
-        
+
         # Arrow
         arrow = "▼" if not self.expanded else "▲"
-        arrow_surf = font_small.render(arrow, True, TEXT_COLOR)
+        arrow_surf = render_text(font_small, arrow, TEXT_COLOR)
         arrow_rect = arrow_surf.get_rect(centery=self.rect.centery)
         arrow_rect.right = self.rect.right - 10
         screen.blit(arrow_surf, arrow_rect)
@@ -195,10 +299,10 @@ class Dropdown:
                 option_rect = pygame.Rect(self.rect.x, self.rect.y + 35 + i * 30, 
                                          self.rect.width, 30)
                 color = BUTTON_HOVER if i == self.selected_index else PANEL_COLOR
-                pygame.draw.rect(screen, color, option_rect, border_radius=3)
-                pygame.draw.rect(screen, ACCENT_COLOR, option_rect, 1, border_radius=3)
-                
-                opt_surf = font_small.render(option, True, TEXT_COLOR)
+                screen.blit(panel_surface(option_rect.size, color, ACCENT_COLOR, 1, 3),
+                            option_rect)
+
+                opt_surf = render_text(font_small, option, TEXT_COLOR)
                 opt_rect = opt_surf.get_rect(centery=option_rect.centery)
                 opt_rect.x = option_rect.x + 10
                 screen.blit(opt_surf, opt_rect)
@@ -249,11 +353,10 @@ class TextInputBox:
     def draw(self, screen):
         # Box
         color = ACCENT_COLOR if self.active else SLIDER_COLOR
-        pygame.draw.rect(screen, INPUT_BOX_COLOR, self.rect, border_radius=3)
-        pygame.draw.rect(screen, color, self.rect, 2, border_radius=3)
-        
+        screen.blit(panel_surface(self.rect.size, INPUT_BOX_COLOR, color, 2, 3), self.rect)
+
         # Text
-        text_surf = self.font.render(self.text, True, TEXT_COLOR)
+        text_surf = render_text(self.font, self.text, TEXT_COLOR)
         screen.blit(text_surf, (self.rect.x + 8, self.rect.y + (self.rect.height - text_surf.get_height()) // 2))
 
         # Blinking Cursor
@@ -273,11 +376,38 @@ class TextInputBox:
 
 class HapticPatternGenerator:
     """Generates stochastic and preset vibration patterns."""
-    
+
+    # The tick path reads a dozen of these 100 times a second; slots turn
+    # each read into a fixed-offset load instead of an instance-dict lookup.
+    __slots__ = ('config', 'cfg', '_rng', '_random', '_uniform', '_choice',
+                 '_getrandbits', 'tick', 'start_time', 'current_time',
+                 'current_phase', 'phase_start_time', 'phase_duration',
+                 'active_motor', 'next_motor', 'left_intensity',
+                 'right_intensity', 'global_multiplier', 'motor_history',
+                 'history_index', 'history_left_count', 'history_right_count',
+                 'left_consecutive', 'right_consecutive', 'motor_switch_time',
+                 'resonance_mode', 'resonance_start_time', 'resonance_duration',
+                 'last_resonance_check', 'pulse_phase_time', 'pulse_cycle',
+                 'cycle_phase_index', 'last_pulse_cycle_index',
+                 'breathing_time', 'breathing_phase', 'breathing_phase_end_time',
+                 '_const_tables', '_breathing_step', '_breathing_table')
+
     def __init__(self, config: Dict):
         self.config = config
+        # Attribute access on a slotted record skips the per-tick string
+        # hashing that self.config['...'] lookups cost in the 100 Hz path.
+        self.cfg = PresetConfig(config)
+        # Dedicated RNG with its draw methods pre-bound: avoids the module-
+        # level instance indirection on every sample and can be seeded for
+        # deterministic pattern testing.
+        self._rng = random.Random()
+        self._random = self._rng.random
+        self._uniform = self._rng.uniform
+        self._choice = self._rng.choice
+        self._getrandbits = self._rng.getrandbits
         self.start_time = None
         self.current_time = 0.0
+        self.global_multiplier = STOCHASTIC_START_INTENSITY_MULTIPLIER
         
         # Stochastic state
         self.left_intensity = 0.0
@@ -288,7 +418,12 @@ class HapticPatternGenerator:
         self.phase_start_time = 0.0
         self.phase_duration = 0.0
         self.next_motor = 'left'
-        self.motor_history = deque(maxlen=5)
+        # Fixed 5-slot ring of recent motor picks with incrementally maintained
+        # counts, so select_next_motor never rescans the history.
+        self.motor_history = [None] * 5
+        self.history_index = 0
+        self.history_left_count = 0
+        self.history_right_count = 0
         self.left_consecutive = 0
         self.right_consecutive = 0
         self.resonance_mode = None
@@ -296,9 +431,12 @@ class HapticPatternGenerator:
         self.resonance_duration = 0.0
         self.last_resonance_check = 0.0
         
-        # State for constant pulse modes
-        self.pulse_time = 0.0
-        
+        # State for constant pulse modes: position inside the current pulse
+        # cycle (ms) plus a cycle counter, tracked incrementally so no tick
+        # ever divides by the cycle length.
+        self.pulse_phase_time = 0.0
+        self.pulse_cycle = 0
+
         # State for Cycle mode
         self.cycle_phase_index = 0
         self.last_pulse_cycle_index = -1
@@ -307,240 +445,349 @@ class HapticPatternGenerator:
         self.breathing_time = 0.0
         self.breathing_phase = 'buzz' # 'buzz' or 'gap'
         self.breathing_phase_end_time = 0.0
-        
+
+        self.tick = self.update_stochastic
+        self.set_mode(config.get('mode', 'stochastic'))
+
+    def set_mode(self, mode: str):
+        """Resolve the per-tick update function for a mode once.
+
+        The session loop calls self.tick(dt) directly instead of comparing
+        mode strings on every 10 ms tick.
+        """
+        if mode == 'breathing_pulse':
+            self.tick = self.update_breathing_pulse
+        elif mode == 'cycle':
+            self.tick = self.update_cycle_pulse
+        elif mode.startswith('constant'):
+            self.tick = functools.partial(self.update_constant_pulse, mode=mode)
+        else:
+            self.tick = self.update_stochastic
+
     def start(self):
         """Start the pattern generator."""
-        self.start_time = time.time()
+        self.cfg = PresetConfig(self.config)
+        self.start_time = time.perf_counter()
         self.current_time = 0.0
-        self.pulse_time = 0.0
+        self.pulse_phase_time = 0.0
+        self.pulse_cycle = 0
         self.cycle_phase_index = 0
         self.last_pulse_cycle_index = -1
         self.breathing_time = 0.0
         self.breathing_phase = 'buzz'
         self.breathing_phase_end_time = 0.0
-        
+        self._const_tables = self._build_constant_tables()
+        if self.cfg.mode.startswith('constant'):
+            self._bind_constant_tick()
+        self._breathing_step = UPDATE_INTERVAL_MS / 1000.0
+        self._breathing_table = (self._build_breathing_table()
+                                 if self.cfg.mode == 'breathing_pulse' else None)
+
+    def _build_constant_tables(self) -> Dict:
+        """Precompute per-millisecond (left, right) tables for constant modes.
+
+        The buzz/gap timing is fixed, so each mode's output is a pure function
+        of pulse_time modulo the table length; the tick path becomes one
+        indexed load instead of mod/floor arithmetic and mode branching.
+        """
+        buzz, gap = CONSTANT_PULSE_BUZZ_MS, CONSTANT_PULSE_GAP_MS
+        silence = [(0.0, 0.0)] * gap
+        tables = {}
+        for mode, key in (('constant_weak', 'weak'),
+                          ('constant_strong', 'strong'),
+                          ('constant_max', 'max')):
+            intensity = clamp(getattr(self.cfg, key), 0, MAX_INTENSITY)
+            tables[mode] = [(intensity, intensity)] * buzz + silence
+        # 'constant_ac' alternates motors each full cycle, so its table spans
+        # two buzz/gap cycles.
+        ac = clamp(self.cfg.max, 0, MAX_INTENSITY)
+        tables['constant_ac'] = ([(ac, 0.0)] * buzz + silence
+                                 + [(0.0, ac)] * buzz + silence)
+        return tables
+
+    def _build_breathing_table(self) -> Tuple[Tuple[float, float], ...]:
+        """Sample one full buzz phase of the breathing-pulse wave.
+
+        Within a buzz phase the wave is a pure function of breathing_time, so
+        the whole phase (cycles x period) is precomputed at the session tick
+        rate and the per-tick path becomes a single table index. Worst-case
+        size is 10 cycles x 30 s at 100 Hz = 30k entries, built once per
+        session start.
+        """
+        cfg = self.cfg
+        min_val = cfg.breathing_pulse_min_intensity
+        max_val = cfg.max
+        base_period = cfg.breathing_pulse_period
+        base_freq = 1.0 / base_period if base_period > 0 else 0
+        beat_freq = (1.0 / cfg.breathing_pulse_sync_period
+                     if cfg.breathing_pulse_sync_period > 0 else 0)
+        freq_left = base_freq
+        freq_right = base_freq + beat_freq
+        center = (max_val + min_val) / 2.0
+        amplitude = (max_val - min_val) / 2.0
+        step = self._breathing_step
+        two_pi = 2 * math.pi
+        count = max(1, int(cfg.breathing_pulse_cycles * base_period / step))
+        table = []
+        for i in range(count):
+            t = i * step
+            left = center + amplitude * sin_lut(two_pi * freq_left * t)
+            right = center + amplitude * sin_lut(two_pi * freq_right * t)
+            table.append((left if left < MAX_INTENSITY else MAX_INTENSITY,
+                          right if right < MAX_INTENSITY else MAX_INTENSITY))
+        return tuple(table)
+
     def get_global_multiplier(self) -> float:
         """Calculate global intensity multiplier for STOCHASTIC mode."""
-        if self.config['peak_time'] <= 0:
+        if self.cfg.peak_time <= 0:
             progress = 1.0
-        elif self.current_time >= self.config['peak_time']:
+        elif self.current_time >= self.cfg.peak_time:
             progress = 1.0
         else:
-            progress = self.current_time / self.config['peak_time']
+            progress = self.current_time / self.cfg.peak_time
         
         eased_progress = ease_in_quad(progress)
         
         base_mult = STOCHASTIC_START_INTENSITY_MULTIPLIER + (1.0 - STOCHASTIC_START_INTENSITY_MULTIPLIER) * eased_progress
         
-        breathing = 1.0 + self.config['breathing_amount'] * math.sin(
-            2 * math.pi * self.current_time / self.config['breathing_period']
+        breathing = 1.0 + self.cfg.breathing_amount * sin_lut(
+            2 * math.pi * self.current_time / self.cfg.breathing_period
         )
         
         return base_mult * breathing
     
+    def record_motor(self, motor: str):
+        """Record a motor pick in the history ring, keeping the counts current."""
+        old = self.motor_history[self.history_index]
+        if old == 'left':
+            self.history_left_count -= 1
+        elif old == 'right':
+            self.history_right_count -= 1
+        self.motor_history[self.history_index] = motor
+        if motor == 'left':
+            self.history_left_count += 1
+        else:
+            self.history_right_count += 1
+        self.history_index = (self.history_index + 1) % 5
+
     def select_next_motor(self) -> str:
         """Select next motor with probabilistic alternation."""
-        left_count = self.motor_history.count('left')
-        right_count = self.motor_history.count('right')
-        
+        left_count = self.history_left_count
+        right_count = self.history_right_count
+
         if self.left_consecutive >= 2: return 'right'
         elif self.right_consecutive >= 2: return 'left'
         
-        alternation_bias = self.config['alternation_bias']
+        alternation_bias = self.cfg.alternation_bias
         
         if left_count > right_count:
-            return 'right' if random.random() < alternation_bias else 'left'
+            return 'right' if self._random() < alternation_bias else 'left'
         elif right_count > left_count:
-            return 'left' if random.random() < alternation_bias else 'right'
+            return 'left' if self._random() < alternation_bias else 'right'
         else:
-            return random.choice(['left', 'right'])
+            return self._choice(['left', 'right'])
     
     def generate_buzz_duration(self) -> float:
         """Generate random buzz duration."""
-        min_buzz = self.config['buzz_min'] / 1000.0
-        max_buzz = self.config['buzz_max'] / 1000.0
-        return random.uniform(min_buzz, max_buzz)
+        min_buzz = self.cfg.buzz_min / 1000.0
+        max_buzz = self.cfg.buzz_max / 1000.0
+        return self._uniform(min_buzz, max_buzz)
     
     def generate_gap_duration(self) -> float:
         """Generate random gap with bias toward shorter gaps."""
-        max_gap_s = self.config['max_gap'] / 1000.0
-        min_gap_s = self.config['gap_min'] / 1000.0
+        max_gap_s = self.cfg.max_gap / 1000.0
+        min_gap_s = self.cfg.gap_min / 1000.0
         
-        t = random.betavariate(2, 3)
+        t = _BETA23_LUT[self._getrandbits(12)]
         gap = min_gap_s + t * (max_gap_s - min_gap_s)
         return gap
     
     def get_base_intensity(self) -> float:
         """Get base intensity by picking a random value between weak and strong."""
-        weak = min(self.config['weak'], self.config['strong'])
-        strong = max(self.config['weak'], self.config['strong'])
-        base = random.uniform(weak, strong)
+        weak = min(self.cfg.weak, self.cfg.strong)
+        strong = max(self.cfg.weak, self.cfg.strong)
+        base = self._uniform(weak, strong)
         return clamp(base, 0, MAX_INTENSITY)
     
     def check_resonance_trigger(self):
         """Check for resonance mode triggers."""
-        if self.resonance_mode is not None or not self.config['resonance_enabled']:
+        if self.resonance_mode is not None or not self.cfg.resonance_enabled:
             return
         
-        check_interval = self.config['resonance_check_interval']
+        check_interval = self.cfg.resonance_check_interval
         if self.current_time - self.last_resonance_check >= check_interval:
             self.last_resonance_check = self.current_time
             
-            if random.random() < self.config['resonance_probability']:
+            if self._random() < self.cfg.resonance_probability:
                 modes = ['mirrored', 'anti_phase', 'offset']
-                self.resonance_mode = random.choice(modes)
+                self.resonance_mode = self._choice(modes)
                 self.resonance_start_time = self.current_time
-                self.resonance_duration = random.uniform(
-                    self.config['resonance_duration_min'],
-                    self.config['resonance_duration_max']
+                self.resonance_duration = self._uniform(
+                    self.cfg.resonance_duration_min,
+                    self.cfg.resonance_duration_max
                 )
     
     def update_stochastic(self, dt: float) -> Tuple[float, float]:
         """Update stochastic pattern. This is the complex, unpredictable mode."""
-        self.current_time += dt
+        # Hot fields and the config live in locals for the duration of the
+        # tick; each LOAD_FAST is ~3x cheaper than the attribute load it
+        # replaces, and this path runs 100 times a second.
+        cfg = self.cfg
+        current_time = self.current_time + dt
+        self.current_time = current_time
         self.check_resonance_trigger()
-        
+
+        # One multiplier evaluation per tick, shared with the resonance path
+        # and published for the visualizer readout.
+        global_mult = self.get_global_multiplier()
+        self.global_multiplier = global_mult
+
         if self.resonance_mode is not None:
-            elapsed = self.current_time - self.resonance_start_time
+            elapsed = current_time - self.resonance_start_time
             if elapsed >= self.resonance_duration:
                 self.resonance_mode = None
             else:
-                return self.update_resonance_mode(elapsed)
-        
-        phase_elapsed = self.current_time - self.phase_start_time
+                return self.update_resonance_mode(elapsed, global_mult)
+
+        phase_elapsed = current_time - self.phase_start_time
         if phase_elapsed >= self.phase_duration:
             if self.current_phase == 'gap':
                 self.current_phase = 'buzz'
                 self.phase_duration = self.generate_buzz_duration()
                 self.next_motor = self.select_next_motor()
-                self.motor_history.append(self.next_motor)
+                self.record_motor(self.next_motor)
                 if self.next_motor == 'left':
                     self.left_consecutive += 1
                     self.right_consecutive = 0
                 else:
                     self.right_consecutive += 1
                     self.left_consecutive = 0
-                self.motor_switch_time = self.current_time
+                self.motor_switch_time = current_time
             else:
                 self.current_phase = 'gap'
                 self.phase_duration = self.generate_gap_duration()
-            self.phase_start_time = self.current_time
-        
-        global_mult = self.get_global_multiplier()
+            self.phase_start_time = current_time
+
         if self.current_phase == 'buzz':
             base_intensity = self.get_base_intensity()
             target_intensity = base_intensity * global_mult
-            
-            switch_elapsed = self.current_time - self.motor_switch_time
-            if switch_elapsed < (CROSSFADE_MS / 1000.0):
-                target_intensity *= (switch_elapsed / (CROSSFADE_MS / 1000.0))
-            
-            if self.current_time < (STARTUP_RAMP_MS / 1000.0):
-                target_intensity *= (self.current_time / (STARTUP_RAMP_MS / 1000.0))
-            
+
+            switch_elapsed = current_time - self.motor_switch_time
+            if switch_elapsed < CROSSFADE_S:
+                target_intensity *= (switch_elapsed / CROSSFADE_S)
+
+            if current_time < STARTUP_RAMP_S:
+                target_intensity *= (current_time / STARTUP_RAMP_S)
+
+            trigger_fires = (cfg.trigger_enabled and target_intensity > cfg.strong
+                             and phase_elapsed > cfg.trigger_delay)
             if self.next_motor == 'left':
                 left = target_intensity
-                right = 0.0
-                if (self.config['trigger_enabled'] and target_intensity > self.config['strong'] and 
-                    phase_elapsed > self.config['trigger_delay']):
-                    right = self.config['weak'] * self.config['trigger_intensity'] * global_mult
+                right = cfg.weak * cfg.trigger_intensity * global_mult if trigger_fires else 0.0
             else:
                 right = target_intensity
-                left = 0.0
-                if (self.config['trigger_enabled'] and target_intensity > self.config['strong'] and 
-                    phase_elapsed > self.config['trigger_delay']):
-                    left = self.config['weak'] * self.config['trigger_intensity'] * global_mult
+                left = cfg.weak * cfg.trigger_intensity * global_mult if trigger_fires else 0.0
         else:
             left, right = 0.0, 0.0
-        
-        return clamp(left, 0, MAX_INTENSITY), clamp(right, 0, MAX_INTENSITY)
-    
-    def update_resonance_mode(self, elapsed: float) -> Tuple[float, float]:
+
+        # Intensities are non-negative by construction, so only the upper
+        # bound needs enforcing; inlined to avoid two calls per tick.
+        return (left if left < MAX_INTENSITY else MAX_INTENSITY,
+                right if right < MAX_INTENSITY else MAX_INTENSITY)
+
+    def update_resonance_mode(self, elapsed: float, global_mult: float) -> Tuple[float, float]:
         """Update resonance mode patterns."""
-        global_mult = self.get_global_multiplier()
-        base = self.config['weak'] * global_mult * self.config['resonance_intensity']
-        freq = self.config['resonance_frequency']
-        phase = 2 * math.pi * freq * elapsed
-        
+        base = self.cfg.weak * global_mult * self.cfg.resonance_intensity
+        freq = self.cfg.resonance_frequency
+        phase_idx = int(2 * math.pi * freq * elapsed * _SIN_SCALE)
+
         if self.resonance_mode == 'mirrored':
-            intensity = base * (0.5 + 0.5 * math.sin(phase))
+            intensity = base * (0.5 + 0.5 * _SIN_LUT[phase_idx & _SIN_MASK])
             return intensity, intensity
         elif self.resonance_mode == 'anti_phase':
-            left = base * (0.5 + 0.5 * math.sin(phase))
-            right = base * (0.5 + 0.5 * math.sin(phase + math.pi))
+            left = base * (0.5 + 0.5 * _SIN_LUT[phase_idx & _SIN_MASK])
+            right = base * (0.5 + 0.5 * _SIN_LUT[(phase_idx + _SIN_HALF) & _SIN_MASK])
             return left, right
         elif self.resonance_mode == 'offset':
-            left = base * (0.5 + 0.5 * math.sin(phase))
-            right = base * (0.5 + 0.5 * math.sin(phase + math.pi / 2))
+            left = base * (0.5 + 0.5 * _SIN_LUT[phase_idx & _SIN_MASK])
+            right = base * (0.5 + 0.5 * _SIN_LUT[(phase_idx + _SIN_QUARTER) & _SIN_MASK])
             return left, right
         return 0.0, 0.0
     
+    def advance_pulse_clock(self, dt: float):
+        """Advance the pulse clock incrementally.
+
+        dt is never more than a few cycle lengths, so a compare-and-subtract
+        loop replaces the division and math.floor the tick paths used to pay.
+        """
+        self.pulse_phase_time += dt * 1000  # work in milliseconds
+        while self.pulse_phase_time >= CONSTANT_PULSE_TOTAL_MS:
+            self.pulse_phase_time -= CONSTANT_PULSE_TOTAL_MS
+            self.pulse_cycle += 1
+
     def update_constant_pulse(self, dt: float, mode: str) -> Tuple[float, float]:
         """Update constant pulse patterns. No ramping, no randomness."""
-        self.pulse_time += dt * 1000 # work in milliseconds
-        
-        total_pulse_duration = CONSTANT_PULSE_BUZZ_MS + CONSTANT_PULSE_GAP_MS
-        phase_time = self.pulse_time % total_pulse_duration
-        
-        left, right = 0.0, 0.0
-        
-        if phase_time < CONSTANT_PULSE_BUZZ_MS:
-            # In the BUZZ part of the pulse
-            intensity = 0.0
-            if mode == 'constant_weak':
-                intensity = self.config['weak']
-            elif mode == 'constant_strong':
-                intensity = self.config['strong']
-            elif mode == 'constant_max':
-                intensity = self.config['max']
-            elif mode == 'constant_ac':
-                intensity = self.config['max']
-            
-            if mode == 'constant_ac':
-                # Alternate motors on each full pulse cycle
-                cycle_index = math.floor(self.pulse_time / total_pulse_duration)
-                if cycle_index % 2 == 0:
-                    left = intensity
-                else:
-                    right = intensity
-            else:
-                left, right = intensity, intensity
-        
-        return clamp(left, 0, MAX_INTENSITY), clamp(right, 0, MAX_INTENSITY)
+        self.advance_pulse_clock(dt)
+
+        table = self._const_tables[mode]
+        index = int(self.pulse_phase_time)
+        if len(table) > CONSTANT_PULSE_TOTAL_MS and self.pulse_cycle & 1:
+            index += CONSTANT_PULSE_TOTAL_MS  # second half of the AC table
+        return table[index]
+
+    def _bind_constant_tick(self):
+        """Specialize self.tick over the mode's freshly built table.
+
+        Closing the table into the tick drops the per-tick dict lookup and
+        the AC length check that the generic update_constant_pulse pays; the
+        output can't collapse to a single precomputed pair because constant
+        modes still pulse through their buzz/gap table.
+        """
+        table = self._const_tables[self.cfg.mode]
+        advance = self.advance_pulse_clock
+        if len(table) > CONSTANT_PULSE_TOTAL_MS:
+            def tick(dt):
+                advance(dt)
+                index = int(self.pulse_phase_time)
+                if self.pulse_cycle & 1:
+                    index += CONSTANT_PULSE_TOTAL_MS
+                return table[index]
+        else:
+            def tick(dt):
+                advance(dt)
+                return table[int(self.pulse_phase_time)]
+        self.tick = tick
 
     def update_cycle_pulse(self, dt: float) -> Tuple[float, float]:
         """Update the pulse-by-pulse cycle mode."""
-        self.pulse_time += dt * 1000  # work in milliseconds
+        self.advance_pulse_clock(dt)
 
-        total_pulse_duration = CONSTANT_PULSE_BUZZ_MS + CONSTANT_PULSE_GAP_MS
-        
         # Determine if a new pulse cycle has started
-        current_pulse_cycle_index = math.floor(self.pulse_time / total_pulse_duration)
-        if current_pulse_cycle_index > self.last_pulse_cycle_index:
+        if self.pulse_cycle > self.last_pulse_cycle_index:
             self.cycle_phase_index = (self.cycle_phase_index + 1) % 4
-            self.last_pulse_cycle_index = current_pulse_cycle_index
+            self.last_pulse_cycle_index = self.pulse_cycle
 
-        phase_time = self.pulse_time % total_pulse_duration
         left, right = 0.0, 0.0
 
-        if phase_time < CONSTANT_PULSE_BUZZ_MS:
+        if self.pulse_phase_time < CONSTANT_PULSE_BUZZ_MS:
             # We are in the "buzz" part of the pulse
             current_phase = self.cycle_phase_index
             
             if current_phase == 0:  # Phase 1: Strong, both motors
-                intensity = self.config['strong']
+                intensity = self.cfg.strong
                 left, right = intensity, intensity
             elif current_phase == 1:  # Phase 2: Max, both motors
-                intensity = self.config['max']
+                intensity = self.cfg.max
                 left, right = intensity, intensity
             elif current_phase == 2:  # Phase 3: Max, left motor only
-                intensity = self.config['max']
+                intensity = self.cfg.max
                 left, right = intensity, 0.0
             elif current_phase == 3:  # Phase 4: Max, right motor only
-                intensity = self.config['max']
+                intensity = self.cfg.max
                 left, right = 0.0, intensity
 
-        return clamp(left, 0, MAX_INTENSITY), clamp(right, 0, MAX_INTENSITY)
+        return (left if left < MAX_INTENSITY else MAX_INTENSITY,
+                right if right < MAX_INTENSITY else MAX_INTENSITY)
 
     def update_breathing_pulse(self, dt: float) -> Tuple[float, float]:
         """Update the breathing pulse mode with beat frequencies and gaps."""
@@ -550,9 +797,9 @@ class HapticPatternGenerator:
             self.breathing_time += dt
             
             # Check if the buzz phase (N cycles) is over
-            buzz_duration = self.config['breathing_pulse_cycles'] * self.config['breathing_pulse_period']
+            buzz_duration = self.cfg.breathing_pulse_cycles * self.cfg.breathing_pulse_period
             if self.breathing_time >= buzz_duration:
-                gap_duration = self.config['breathing_pulse_gap']
+                gap_duration = self.cfg.breathing_pulse_gap
                 if gap_duration > 0:
                     self.breathing_phase = 'gap'
                     self.breathing_phase_end_time = self.current_time + gap_duration
@@ -561,28 +808,15 @@ class HapticPatternGenerator:
                     # No gap, just loop the breathing time
                     self.breathing_time = 0.0
 
-            # Get parameters from config
-            min_val = self.config['breathing_pulse_min_intensity']
-            max_val = self.config['max']
-            base_period = self.config['breathing_pulse_period']
-            sync_period = self.config['breathing_pulse_sync_period']
-            
-            base_freq = 1.0 / base_period if base_period > 0 else 0
-            beat_freq = 1.0 / sync_period if sync_period > 0 else 0
-            
-            freq_left = base_freq
-            freq_right = base_freq + beat_freq
-            
-            center = (max_val + min_val) / 2.0
-            amplitude = (max_val - min_val) / 2.0
-            
-            phase_left = 2 * math.pi * freq_left * self.breathing_time
-            intensity_left = center + amplitude * math.sin(phase_left)
-            
-            phase_right = 2 * math.pi * freq_right * self.breathing_time
-            intensity_right = center + amplitude * math.sin(phase_right)
-            
-            return clamp(intensity_left, 0, MAX_INTENSITY), clamp(intensity_right, 0, MAX_INTENSITY)
+            # The wave is precomputed for the whole buzz phase; the tick cost
+            # is one division and a table load.
+            table = self._breathing_table
+            if table is None:
+                table = self._breathing_table = self._build_breathing_table()
+            idx = int(self.breathing_time / self._breathing_step)
+            if idx >= len(table):
+                idx = len(table) - 1
+            return table[idx]
 
         elif self.breathing_phase == 'gap':
             if self.current_time >= self.breathing_phase_end_time:
@@ -603,7 +837,11 @@ class ControllerManager:
     def __init__(self):
         self.joystick = None
         self.supports_rumble = False
-        
+        self._rumble = None
+        self._last_left = -1
+        self._last_right = -1
+        self._last_send_time = 0.0
+
     def initialize(self) -> bool:
         """Initialize and detect controller."""
         try:
@@ -617,6 +855,10 @@ class ControllerManager:
                     if joy.rumble(0, 0, 0):
                         self.joystick = joy
                         self.supports_rumble = True
+                        # Bound once: the 100 Hz session loop calls this
+                        # through one LOAD_FAST-able reference instead of two
+                        # attribute lookups per send.
+                        self._rumble = joy.rumble
                         print(f"[DEBUG] Controller '{joy.get_name()}' supports rumble.")
                         return True
                 except pygame.error:
@@ -626,15 +868,30 @@ class ControllerManager:
             return False
     
     def set_rumble(self, left: float, right: float):
-        """Set rumble intensities."""
+        """Set rumble intensities, coalescing sends that change nothing."""
         if self.joystick and self.supports_rumble:
-            left_norm = clamp(left / 255.0, 0.0, 1.0)
-            right_norm = clamp(right / 255.0, 0.0, 1.0)
+            # Quantize to the motors' 8-bit resolution up front so the
+            # duplicate check is an exact integer compare.
+            left_int = 0 if left <= 0 else (MAX_INTENSITY if left >= MAX_INTENSITY else int(left))
+            right_int = 0 if right <= 0 else (MAX_INTENSITY if right >= MAX_INTENSITY else int(right))
+            if left_int == self._last_left and right_int == self._last_right:
+                # Stopped motors need no keep-alive; running ones only need a
+                # refresh every 50 ms (the rumble duration is 100 ms).
+                if left_int == 0 and right_int == 0:
+                    return
+                if time.perf_counter() - self._last_send_time < 0.05:
+                    return
+            # pygame's rumble binding wraps SDL's rumble call directly; the
+            # coalescing above already removes most sends, so the remaining
+            # calls are too rare to be worth bypassing pygame over.
             try:
-                self.joystick.rumble(left_norm, right_norm, 100)
+                self._rumble(left_int / 255.0, right_int / 255.0, 100)
+                self._last_left = left_int
+                self._last_right = right_int
+                self._last_send_time = time.perf_counter()
             except pygame.error:
                 pass
-    
+
     def stop(self):
         """Stop rumble."""
         if self.joystick and self.supports_rumble:
@@ -642,6 +899,9 @@ class ControllerManager:
                 self.joystick.rumble(0, 0, 0)
             except pygame.error:
                 pass
+            self._last_left = -1
+            self._last_right = -1
+            self._last_send_time = 0.0
     
     def get_name(self) -> str:
         """Get controller name."""
@@ -653,76 +913,292 @@ class ControllerManager:
 # PRESET MANAGER
 # ============================================================================
 
+# Built once at import. get_default_config hands out copies (callers mutate
+# their config), while the preset table itself is shared read-only.
+_DEFAULT_CONFIG = {
+    'session_length': 60, 'peak_time': 60, 'weak': 60, 'strong': 160, 'max': 255,
+    'buzz_min': 100, 'buzz_max': 2000, 'gap_min': 100, 'max_gap': 270,
+    'variance': 0.125, 'alternation_bias': 0.7, 'breathing_amount': 0.1, 'breathing_period': 15.0,
+    'trigger_enabled': True, 'trigger_delay': 0.5, 'trigger_intensity': 0.5,
+    'resonance_enabled': True, 'resonance_probability': 0.1, 'resonance_check_interval': 5.0,
+    'resonance_duration_min': 2.0, 'resonance_duration_max': 5.0, 'resonance_frequency': 2.0,
+    'resonance_intensity': 1.0, 'mode': 'stochastic',
+    'breathing_pulse_period': 8.0, 'breathing_pulse_sync_period': 30.0,
+    'breathing_pulse_min_intensity': 80, 'breathing_pulse_cycles': 1, 'breathing_pulse_gap': 0.0,
+}
+
+_DEFAULT_PRESETS = {
+    'Gentle Massage': {'session_length': 300, 'peak_time': 300, 'weak': 40, 'strong': 100, 'buzz_min': 200, 'buzz_max': 1000, 'gap_min': 200, 'max_gap': 1500, 'variance': 0.1, 'breathing_amount': 0.15, 'resonance_probability': 0.05},
+    'Standard Session': {'session_length': 1620, 'peak_time': 1620, 'weak': 60, 'strong': 160, 'buzz_min': 100, 'buzz_max': 2000, 'max_gap': 1800, 'variance': 0.125},
+    'Intense Workout': {'session_length': 900, 'peak_time': 600, 'weak': 100, 'strong': 200, 'max': 255, 'buzz_min': 150, 'buzz_max': 2500, 'gap_min': 50, 'max_gap': 1000, 'variance': 0.15, 'alternation_bias': 0.8, 'resonance_probability': 0.15},
+    'Quick Test': {'session_length': 60, 'peak_time': 30, 'weak': 80, 'strong': 160, 'buzz_min': 200, 'buzz_max': 800, 'max_gap': 500},
+    'Rhythmic Flow': {'session_length': 600, 'peak_time': 600, 'weak': 70, 'strong': 150, 'buzz_min': 300, 'buzz_max': 1200, 'max_gap': 1000, 'variance': 0.08, 'breathing_amount': 0.2, 'breathing_period': 10.0, 'resonance_enabled': True, 'resonance_probability': 0.2, 'resonance_duration_min': 3.0, 'resonance_duration_max': 7.0},
+    'Cycle': {'session_length': 3600, 'peak_time': 1620, 'weak': 60, 'strong': 160, 'max': 255, 'buzz_min': 100, 'buzz_max': 2000, 'max_gap': 1800, 'variance': 0.125},
+    'Breathing Pulse': {'session_length': 3600, 'strong': 150, 'max': 220, 'breathing_pulse_period': 10.0,
+                        'breathing_pulse_sync_period': 45.0, 'breathing_pulse_min_intensity': 150,
+                        'breathing_pulse_cycles': 2, 'breathing_pulse_gap': 1.5},
+}
+
+# Canonical interned forms of the config keys. Source literals are interned
+# by the compiler already; loaded JSON allocates fresh strings per preset, so
+# mapping them back means one str object per key across the whole library and
+# identity-shortcut dict lookups.
+_KNOWN_KEYS = frozenset(sys.intern(k) for k in _DEFAULT_CONFIG)
+
+def _normalize_presets(data: Dict) -> Dict:
+    """Validate a parsed preset file against the known config schema.
+
+    One pass drops unknown fields (stale keys from older versions or a
+    hand-edited file) and interns the surviving keys, so everything past the
+    loader is a known, canonical key and downstream merges need no guards.
+    Works identically for both JSON parsers.
+    """
+    if not isinstance(data, dict):
+        return {}
+    out = {}
+    for name, cfg in data.items():
+        if isinstance(cfg, dict):
+            out[name] = {sys.intern(k): v for k, v in cfg.items() if k in _KNOWN_KEYS}
+    return out
+
+class PresetConfig:
+    """Flat, slotted record of one complete configuration.
+
+    Attribute reads are fixed-offset slot loads, which the generator's 100 Hz
+    update path prefers over dict hashing or a SimpleNamespace's per-instance
+    dict. Missing keys fall back to the defaults, matching how presets only
+    override a subset of fields.
+    """
+    __slots__ = tuple(_DEFAULT_CONFIG)
+
+    def __init__(self, values: Dict):
+        defaults = _DEFAULT_CONFIG
+        for key in self.__slots__:
+            setattr(self, key, values.get(key, defaults[key]))
+
+class PresetView(collections.abc.Mapping):
+    """Read-only preset that resolves missing keys against a shared base.
+
+    Presets override only a handful of the ~30 config fields, so wrapping the
+    override dict instead of merging it over a copy of the defaults avoids a
+    full-width dict allocation per preset and keeps one shared base mapping.
+    """
+    __slots__ = ('_base', '_overrides')
+
+    def __init__(self, base: Dict, overrides: Dict):
+        self._base = base
+        self._overrides = overrides
+
+    def __getitem__(self, key):
+        try:
+            return self._overrides[key]
+        except KeyError:
+            return self._base[key]
+
+    def __iter__(self):
+        return iter(self._base.keys() | self._overrides.keys())
+
+    def __len__(self):
+        return len(self._base.keys() | self._overrides.keys())
+
 class PresetManager:
     """Manages default and user-saved configuration presets."""
-    
+
+    # Fixed attribute layout: slot loads are cheaper than instance-dict
+    # lookups, and a typo'd attribute fails loudly instead of creating one.
+    __slots__ = ('filepath', 'default_presets', '_default_names', '_load_lock',
+                 '_custom_presets', '_merged_cache', '_version', '_dirty',
+                 '_batch_depth', '_ser_buf', '_last_saved_digest')
+
+    # Last successful disk load, kept for the process lifetime so a
+    # re-created manager serves presets without touching the file again.
+    _disk_cache: Optional[Dict] = None
+
     def __init__(self, filepath="user_presets.json"):
         self.filepath = filepath
         self.default_presets = self._get_default_presets()
-        self.custom_presets = self.load_custom_presets()
+        # Frozenset membership beats dict membership by a hair and makes the
+        # reserved-name guard in save_preset a single lookup.
+        self._default_names = frozenset(self.default_presets)
+        self._load_lock = threading.Lock()
+        self._custom_presets = PresetManager._disk_cache
+        self._merged_cache = None
+        # Monotonic generation counter, bumped on every mutation so cached
+        # lookups keyed on it invalidate without explicit clearing.
+        self._version = 0
+        self._dirty = False
+        self._batch_depth = 0
+        # Reusable byte buffer for serialization, so repeated saves write
+        # through one allocation instead of a fresh bytes object each time.
+        self._ser_buf = bytearray()
+        self._last_saved_digest: Optional[bytes] = None
+        # Whatever happens, pending edits reach disk on interpreter exit.
+        atexit.register(self.flush)
+        if self._custom_presets is None:
+            # Warm the cache off the GUI thread; started last so the worker
+            # never observes a half-built instance. First access races the
+            # refresh and whichever side wins, the other discards its work.
+            threading.Thread(target=self._refresh_from_disk, daemon=True).start()
+
+    def _refresh_from_disk(self):
+        """Background warm-up: load presets without blocking the first render."""
+        loaded = self.load_custom_presets()
+        with self._load_lock:
+            if self._custom_presets is None:
+                self._custom_presets = loaded
+                PresetManager._disk_cache = loaded
+                self._version += 1
+
+    @property
+    def custom_presets(self) -> Dict:
+        """Custom presets, served from cache once either loader has run.
+
+        Startup kicks off a background read; by the time the GUI first asks,
+        the data is usually ready and this never blocks. If asked before the
+        refresh lands, the load happens synchronously here instead.
+        """
+        if self._custom_presets is None:
+            with self._load_lock:
+                if self._custom_presets is None:
+                    self._custom_presets = self.load_custom_presets()
+                    PresetManager._disk_cache = self._custom_presets
+                    self._version += 1
+        return self._custom_presets
 
     def load_custom_presets(self) -> Dict:
         """Loads custom presets from the JSON file."""
+        # A fresh install has no preset file; the existence check skips the
+        # exception machinery that open() would otherwise trigger.
+        if not os.path.exists(self.filepath):
+            return {}
         try:
-            with open(self.filepath, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            # Map the file instead of read(): the parser walks the kernel's
+            # page cache directly, skipping the intermediate bytes copy.
+            with open(self.filepath, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if orjson is not None:
+                        data = orjson.loads(memoryview(mm))
+                    else:
+                        # stdlib json requires a real bytes object.
+                        data = json.loads(mm[:])
+            return _normalize_presets(data)
+        except (OSError, ValueError):
+            # Either parser's decode error subclasses ValueError, and mmap
+            # raises it for an empty file; all of those mean "no presets".
             return {}
 
     def save_custom_presets(self):
         """Saves the current custom presets to the JSON file."""
-        with open(self.filepath, 'w') as f:
-            json.dump(self.custom_presets, f, indent=4)
+        # Serialize in memory and issue a single write: json.dump with
+        # indent=4 streamed many small writes and produced ~4x the bytes for
+        # a file only this program reads back.
+        buf = self._ser_buf
+        buf.clear()
+        if orjson is not None:
+            buf += orjson.dumps(self.custom_presets)
+        else:
+            buf += json.dumps(self.custom_presets, separators=(',', ':')).encode('utf-8')
+        # Edit flows that end where they started (save then delete, re-saving
+        # an identical preset) produce byte-identical output; hashing it is
+        # orders of magnitude cheaper than the fsync the write would cost.
+        digest = hashlib.blake2b(buf, digest_size=16).digest()
+        if digest == self._last_saved_digest:
+            return
+        # Write-temp-then-rename with one fsync: a crash mid-save can no
+        # longer truncate the user's preset file, and the save costs exactly
+        # one durability point instead of scattered metadata flushes.
+        tmp_path = self.filepath + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(buf)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.filepath)
+        self._last_saved_digest = digest
+        # Don't let one oversized export pin memory for the rest of the run.
+        if len(buf) > 131072:
+            self._ser_buf = bytearray()
+
+    def _mark_dirty(self):
+        """Record a pending change, writing through unless inside batch()."""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self):
+        """Write custom presets to disk if there are unsaved changes."""
+        if self._dirty:
+            self.save_custom_presets()
+            self._dirty = False
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Defer preset writes inside the block to one flush on exit.
+
+        Bulk operations (importing several presets, scripted edits) would
+        otherwise rewrite the whole file once per mutation.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
 
     def get_all_presets(self) -> Dict:
-        """Returns a merged dictionary of default and custom presets."""
-        return {**self.default_presets, **self.custom_presets}
+        """Returns a merged dictionary of default and custom presets.
+
+        Values are PresetView mappings resolved over the default config, so
+        callers read fully-populated presets without any per-preset merge.
+        """
+        # Presets only change through save/delete, so the merge is cached and
+        # rebuilt lazily instead of reallocating a dict per GUI refresh.
+        if self._merged_cache is None:
+            defaults = _DEFAULT_CONFIG
+            merged = {name: PresetView(defaults, overrides)
+                      for name, overrides in self.default_presets.items()}
+            merged.update((name, PresetView(defaults, overrides))
+                          for name, overrides in self.custom_presets.items())
+            self._merged_cache = merged
+        return self._merged_cache
 
     def save_preset(self, name: str, config: Dict):
         """Saves a new custom preset."""
-        if name and name not in self.default_presets:
+        if name and name not in self._default_names:
             self.custom_presets[name] = config
-            self.save_custom_presets()
+            self._merged_cache = None
+            self._version += 1
+            self._mark_dirty()
 
     def delete_preset(self, name: str):
         """Deletes a custom preset."""
-        if name in self.custom_presets:
-            del self.custom_presets[name]
-            self.save_custom_presets()
+        # pop() resolves the key once; the `in` + `del` pair hashed it twice.
+        if self.custom_presets.pop(name, None) is not None:
+            self._merged_cache = None
+            self._version += 1
+            self._mark_dirty()
     
+    @functools.lru_cache(maxsize=256)
+    def _is_custom(self, name: str, version: int) -> bool:
+        """Memoized membership test, keyed on the preset generation."""
+        return name in self.custom_presets
+
     def is_custom_preset(self, name: str) -> bool:
         """Checks if a preset is a custom one."""
-        return name in self.custom_presets
+        # The GUI asks this for the same handful of names every refresh;
+        # passing the generation counter makes stale entries unreachable
+        # after any mutation without clearing the cache.
+        return self._is_custom(name, self._version)
 
     @staticmethod
     def get_default_config():
-        """Get default configuration."""
-        return {
-            'session_length': 60, 'peak_time': 60, 'weak': 60, 'strong': 160, 'max': 255,
-            'buzz_min': 100, 'buzz_max': 2000, 'gap_min': 100, 'max_gap': 270,
-            'variance': 0.125, 'alternation_bias': 0.7, 'breathing_amount': 0.1, 'breathing_period': 15.0,
-            'trigger_enabled': True, 'trigger_delay': 0.5, 'trigger_intensity': 0.5,
-            'resonance_enabled': True, 'resonance_probability': 0.1, 'resonance_check_interval': 5.0,
-            'resonance_duration_min': 2.0, 'resonance_duration_max': 5.0, 'resonance_frequency': 2.0,
-            'resonance_intensity': 1.0, 'mode': 'stochastic',
-            'breathing_pulse_period': 8.0, 'breathing_pulse_sync_period': 30.0,
-            'breathing_pulse_min_intensity': 80, 'breathing_pulse_cycles': 1, 'breathing_pulse_gap': 0.0,
-        }
-    
+        """Get a fresh copy of the default configuration."""
+        return dict(_DEFAULT_CONFIG)
+
     @staticmethod
     def _get_default_presets():
-        """Get preset configurations."""
-        return {
-            'Gentle Massage': {'session_length': 300, 'peak_time': 300, 'weak': 40, 'strong': 100, 'buzz_min': 200, 'buzz_max': 1000, 'gap_min': 200, 'max_gap': 1500, 'variance': 0.1, 'breathing_amount': 0.15, 'resonance_probability': 0.05},
-            'Standard Session': {'session_length': 1620, 'peak_time': 1620, 'weak': 60, 'strong': 160, 'buzz_min': 100, 'buzz_max': 2000, 'max_gap': 1800, 'variance': 0.125},
-            'Intense Workout': {'session_length': 900, 'peak_time': 600, 'weak': 100, 'strong': 200, 'max': 255, 'buzz_min': 150, 'buzz_max': 2500, 'gap_min': 50, 'max_gap': 1000, 'variance': 0.15, 'alternation_bias': 0.8, 'resonance_probability': 0.15},
-            'Quick Test': {'session_length': 60, 'peak_time': 30, 'weak': 80, 'strong': 160, 'buzz_min': 200, 'buzz_max': 800, 'max_gap': 500},
-            'Rhythmic Flow': {'session_length': 600, 'peak_time': 600, 'weak': 70, 'strong': 150, 'buzz_min': 300, 'buzz_max': 1200, 'max_gap': 1000, 'variance': 0.08, 'breathing_amount': 0.2, 'breathing_period': 10.0, 'resonance_enabled': True, 'resonance_probability': 0.2, 'resonance_duration_min': 3.0, 'resonance_duration_max': 7.0},
-            'Cycle': {'session_length': 3600, 'peak_time': 1620, 'weak': 60, 'strong': 160, 'max': 255, 'buzz_min': 100, 'buzz_max': 2000, 'max_gap': 1800, 'variance': 0.125},
-            'Breathing Pulse': {'session_length': 3600, 'strong': 150, 'max': 220, 'breathing_pulse_period': 10.0, 
-                                'breathing_pulse_sync_period': 45.0, 'breathing_pulse_min_intensity': 150, 
-                                'breathing_pulse_cycles': 2, 'breathing_pulse_gap': 1.5},
-        }
+        """Get the (shared, read-only) preset configurations."""
+        return _DEFAULT_PRESETS
 
 # ============================================================================
 # MAIN GUI APPLICATION
@@ -732,10 +1208,30 @@ class Wave2JoyGUI:
     """Main GUI application."""
     
     def __init__(self):
+        # The render thread and the 100 Hz session thread share the GIL; with
+        # the default 5 ms switch interval the session thread can hold it for
+        # a third of a 16.6 ms frame budget. 1 ms trades a little context-
+        # switch overhead for steadier frame pacing while a session runs.
+        # On a free-threaded build (PEP 703) there is no GIL to time-slice,
+        # so the tweak is skipped and the threads simply run in parallel.
+        if getattr(sys, '_is_gil_enabled', lambda: True)():
+            sys.setswitchinterval(0.001)
         pygame.init()
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Wave2Joy - Haptic Controller")
         self.clock = pygame.time.Clock()
+
+        # Only queue the event types the GUI actually handles; joystick axis
+        # noise gets dropped at the SDL layer instead of being drained and
+        # ignored in Python every frame.  Expose/restore events stay allowed:
+        # the dirty-rect update path never repaints the full window on its
+        # own, so these are the only trigger for a full flip after the OS
+        # invalidates the window contents.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEMOTION,
+                                  pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                                  pygame.KEYDOWN,
+                                  pygame.WINDOWRESTORED, pygame.WINDOWEXPOSED])
         
         # Fonts
         self.font_large = pygame.font.Font(None, 36)
@@ -761,6 +1257,9 @@ class Wave2JoyGUI:
         
         # Tooltip state and content
         self.active_tooltip_text = None
+        # Fully composed tooltip boxes (panel + border + text), keyed by
+        # text; bounded by the size of the tooltips table below.
+        self._tooltip_cache = {}
         self.tooltips = {
             'preset': "Load pre-configured settings for different experiences.",
             'mode': "Choose the core behavior of the vibration pattern.\n'stochastic' is random, others are predictable.",
@@ -807,8 +1306,6 @@ class Wave2JoyGUI:
         self.mode_dropdown = Dropdown(290, 80, 200, "Mode:", modes, default_mode_index)
         
         # UI for saving/deleting presets
-        preset_name_label = self.font_small.render("Preset Name:", True, TEXT_COLOR)
-        self.screen.blit(preset_name_label, (20, 130))
         self.preset_name_input = TextInputBox(20, 150, 250, 30, self.font_small)
         self.save_preset_button = Button(290, 150, 95, 30, "Save Preset", self.save_current_preset)
         self.delete_preset_button = Button(395, 150, 115, 30, "Delete Preset", self.delete_selected_preset)
@@ -824,6 +1321,8 @@ class Wave2JoyGUI:
         self.start_button = Button(start_x, button_y, button_width, 50, "Start Session", self.start_session)
         self.stop_button = Button(start_x + button_width + gap, button_y, button_width, 50, "Stop Session", self.stop_session)
         self.stop_button.enabled = False
+        self._buttons = (self.start_button, self.stop_button,
+                         self.save_preset_button, self.delete_preset_button)
 
         slider_definitions = {
             'session_length': {"label": "Session Length (s)", "min": 10, "max": 3600, "step": 10},
@@ -899,6 +1398,78 @@ class Wave2JoyGUI:
             y += slider_row_height
             y_positions[col] = y
 
+        # Frozen widget collections: handle_events and draw iterate these
+        # every frame, so build them once instead of concatenating fresh
+        # lists per event.
+        self._slider_list = tuple(self.sliders.values())
+        self._ui_elements = (self.preset_dropdown, self.mode_dropdown,
+                             self.start_button, self.stop_button,
+                             self.save_preset_button, self.delete_preset_button,
+                             self.preset_name_input) + self._slider_list
+
+        # Regions that can change from frame to frame, each paired with the
+        # widget whose state decides whether it actually did. draw() compares
+        # snapshots against the previous frame and only pushes regions whose
+        # content moved, so an idle window uploads nothing.
+        # 8 px of slack on the left covers the handle circle, whose center
+        # sits on rect.x when a slider is at its minimum.
+        self._slider_regions = tuple(
+            (slider, pygame.Rect(slider.rect.x - 8, slider.rect.y - 20,
+                                 slider.rect.width + 78, slider.rect.height + 40))
+            for slider in self._slider_list)
+        self._button_regions = tuple((button, button.rect) for button in self._buttons)
+        self._status_rect = pygame.Rect(WINDOW_WIDTH - 340, 20, 340, 30)
+        self._timer_rect = pygame.Rect(20, 180, 500, 25)
+        self._vis_area = self.vis_rect.inflate(40, 0)
+        self._region_states = {}
+        # Tooltip hit targets never move after layout; precompute the scan
+        # list and a bounding box over all label rows so the common case
+        # (mouse not over any label) is a single collidepoint.
+        self._tooltip_targets = tuple(list(self.sliders.items()) +
+                                      [('preset', self.preset_dropdown),
+                                       ('mode', self.mode_dropdown)])
+        bbox = None
+        for _, element in self._tooltip_targets:
+            row = pygame.Rect(element.rect.x, element.rect.y - 20, element.rect.width, 20)
+            bbox = row if bbox is None else bbox.union(row)
+        self._tooltip_bbox = bbox
+        # The tips column re-blits over the visualizer panel every frame;
+        # pre-render and pre-position the lines so one blits() call replaces
+        # five Python-level blit round trips.
+        tips = ("Tips:", "• Use presets for quick starts", "• Hover over settings for tooltips",
+                "• Take breaks every 10-15 min", "• Adjust intensity for comfort")
+        tips_y = self.vis_rect.bottom - 120
+        self._tip_blits = tuple(
+            (render_text(self.font_small, tip, TEXT_COLOR if i == 0 else (150, 150, 160)),
+             (self.vis_rect.x + 20, tips_y + i * 20))
+            for i, tip in enumerate(tips))
+        self._prev_extra_rects = []
+        self._tooltip_rect = None
+        self._last_mouse_pos = None
+        self._full_redraw = True
+        self._needs_redraw = True
+        self._build_static_background()
+
+    def _build_static_background(self):
+        """Pre-render the chrome that never changes into one surface."""
+        bg = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        bg.fill(BG_COLOR)
+        bg.blit(self.font_large.render("Wave2Joy", True, ACCENT_COLOR), (20, 20))
+        bg.blit(self.font_small.render("Preset Name:", True, TEXT_COLOR), (20, 130))
+        for label, x, y in self.sections:
+            if label:  # Don't draw title for empty-titled sections
+                bg.blit(self.font_small.render(label, True, ACCENT_COLOR), (x, y))
+        self._static_bg = bg
+
+    @staticmethod
+    def _dropdown_area(dropdown):
+        """Rect covering a dropdown's label, box, and expanded option list."""
+        area = pygame.Rect(dropdown.rect.x, dropdown.rect.y - 20,
+                           dropdown.rect.width, dropdown.rect.height + 20)
+        if dropdown.expanded:
+            area.height += 35 + len(dropdown.options) * 30
+        return area
+
     def apply_preset(self, preset_name: str):
         """Apply a preset configuration."""
         if preset_name == 'Custom': return
@@ -970,12 +1541,18 @@ class Wave2JoyGUI:
         if not self.controller_connected: return
         
         self.update_config_from_ui()
+        # Freeze the config for the session thread: it reads this snapshot,
+        # never the live dict the sliders mutate, so the two threads share no
+        # writable state besides the output scalars.
+        self._session_config = dict(self.config)
         self.session_active = True
         self.session_completed_flag = False
         self.start_button.enabled = False
         self.stop_button.enabled = True
-        self.session_start_time = time.time()
-        
+        self.session_start_time = time.perf_counter()
+
+        if _winmm:
+            _winmm.timeBeginPeriod(1)
         self.session_thread = threading.Thread(target=self.run_session, daemon=True)
         self.session_thread.start()
     
@@ -987,6 +1564,8 @@ class Wave2JoyGUI:
     
     def _handle_session_end(self):
         """Thread-safe method to clean up after a session ends."""
+        if _winmm:
+            _winmm.timeEndPeriod(1)
         self.session_completed_flag = False
         self.start_button.enabled = True
         self.stop_button.enabled = False
@@ -998,124 +1577,141 @@ class Wave2JoyGUI:
 
     def run_session(self):
         """Run vibration session (in separate thread)."""
-        self.pattern_gen = HapticPatternGenerator(self.config)
+        config = self._session_config
+        self.pattern_gen = HapticPatternGenerator(config)
         self.pattern_gen.start()
-        last_update = time.time()
-        
+        # Loop invariants resolved once: the config is frozen for the
+        # session's duration and tick is already bound to the mode's update
+        # method, so the hot loop runs on LOAD_FAST locals only.
+        tick = self.pattern_gen.tick
+        session_length = config['session_length']
+        start_time = self.session_start_time
+        # perf_counter is monotonic: an NTP step or DST change mid-session
+        # can no longer stretch or truncate the pattern timing.
+        period = UPDATE_INTERVAL_MS / 1000.0
+        perf = time.perf_counter
+        sleep = time.sleep
+        set_rumble = self.controller.set_rumble
+        last_update = perf()
+        next_tick = last_update + period
+        inv_fadeout = 1.0 / FADEOUT_S
+        was_silent = False
+
         while self.session_active:
-            current = time.time()
+            current = perf()
             dt = current - last_update
             last_update = current
-            
-            elapsed = current - self.session_start_time
-            if elapsed >= self.config['session_length']:
+
+            elapsed = current - start_time
+            if elapsed >= session_length:
                 self.session_active = False
                 break
-            
-            left, right = 0.0, 0.0
-            
-            if self.config['mode'] == 'stochastic':
-                left, right = self.pattern_gen.update_stochastic(dt)
-            elif self.config['mode'] == 'breathing_pulse':
-                left, right = self.pattern_gen.update_breathing_pulse(dt)
-            elif self.config['mode'] == 'cycle':
-                left, right = self.pattern_gen.update_cycle_pulse(dt)
-            else: # All other constant modes
-                left, right = self.pattern_gen.update_constant_pulse(dt, self.config['mode'])
-            
-            time_remaining = self.config['session_length'] - elapsed
-            if time_remaining < (FADEOUT_MS / 1000.0):
-                fade_mult = time_remaining / (FADEOUT_MS / 1000.0)
-                left *= fade_mult
-                right *= fade_mult
-            
+
+            left, right = tick(dt)
+
+            # min() clamps the fade to 1.0 outside the fadeout window, so the
+            # multiply is unconditional and the per-tick division is gone.
+            fade_mult = min(1.0, (session_length - elapsed) * inv_fadeout)
+            left *= fade_mult
+            right *= fade_mult
+
             self.current_left = left
             self.current_right = right
-            self.controller.set_rumble(left, right)
-            time.sleep(UPDATE_INTERVAL_MS / 1000.0)
-        
+            # During gaps there is nothing to send and nothing to keep alive;
+            # skip the call entirely until output resumes. Non-zero values
+            # always go through because set_rumble owns the 50 ms keep-alive.
+            if left > 0 or right > 0 or not was_silent:
+                set_rumble(left, right)
+            was_silent = left <= 0 and right <= 0
+            # Absolute deadline schedule: each tick aims at next_tick rather
+            # than sleeping a relative interval, so neither work time nor
+            # sleep() overshoot accumulates as drift. Sleep all but the last
+            # half millisecond, then spin out the remainder.
+            slack = next_tick - perf()
+            if slack > 0.001:
+                sleep(slack - 0.0005)
+            while perf() < next_tick:
+                pass
+            if slack < -period:
+                # More than a full tick behind (suspend, debugger): resync
+                # rather than firing a burst of catch-up ticks.
+                next_tick = perf()
+            next_tick += period
+
         self.controller.stop()
         self.session_completed_flag = True
 
     def draw_header(self):
-        """Draw header section."""
-        title = self.font_large.render("Wave2Joy", True, ACCENT_COLOR)
-        self.screen.blit(title, (20, 20))
-        
+        """Draw the dynamic header parts (title lives on the static background)."""
         status_text = f"Controller: {self.controller.get_name()}"
         status_color = ACTIVE_COLOR if self.controller_connected else WARNING_COLOR
-        status = self.font_small.render(status_text, True, status_color)
-        self.screen.blit(status, (WINDOW_WIDTH - 340, 25))
-        
+        self.screen.blit(render_text(self.font_small, status_text, status_color),
+                         (WINDOW_WIDTH - 340, 25))
+
         if self.session_active:
-            elapsed = time.time() - self.session_start_time
+            elapsed = time.perf_counter() - self.session_start_time
             remaining = max(0, self.config['session_length'] - elapsed)
             time_text = f"Time: {int(elapsed)}s / {int(self.config['session_length'])}s ({int(remaining)}s left)"
+            # The timer string changes every second, so caching it would only
+            # churn the text cache; render it directly.
             time_surf = self.font_small.render(time_text, True, ACTIVE_COLOR)
             self.screen.blit(time_surf, (20, 185))
     
     def draw_visualizer(self):
         """Draw real-time visualization."""
-        pygame.draw.rect(self.screen, PANEL_COLOR, self.vis_rect, border_radius=10)
-        pygame.draw.rect(self.screen, ACCENT_COLOR, self.vis_rect, 2, border_radius=10)
-        
-        vis_title = self.font_medium.render("Live Output", True, TEXT_COLOR)
-        self.screen.blit(vis_title, (self.vis_rect.x + 20, 95))
+        self.screen.blit(panel_surface(self.vis_rect.size, PANEL_COLOR,
+                                       ACCENT_COLOR, 2, 10), self.vis_rect)
         
-        left_label = self.font_small.render("Left Motor (Low Freq)", True, TEXT_COLOR)
-        self.screen.blit(left_label, (self.vis_rect.x + 20, 140))
+        self.screen.blit(render_text(self.font_medium, "Live Output", TEXT_COLOR),
+                         (self.vis_rect.x + 20, 95))
+
+        self.screen.blit(render_text(self.font_small, "Left Motor (Low Freq)", TEXT_COLOR),
+                         (self.vis_rect.x + 20, 140))
         left_bar_rect = pygame.Rect(self.vis_rect.x + 20, 165, 270, 40)
-        pygame.draw.rect(self.screen, SLIDER_COLOR, left_bar_rect, border_radius=5)
+        self.screen.blit(panel_surface(left_bar_rect.size, SLIDER_COLOR, radius=5), left_bar_rect)
         if self.current_left > 0:
-            left_fill = pygame.Rect(left_bar_rect.x, 165, int(270 * self.current_left / 255), 40)
-            pygame.draw.rect(self.screen, ACTIVE_COLOR, left_fill, border_radius=5)
-        left_value = self.font_small.render(f"{int(self.current_left)}", True, TEXT_COLOR)
-        self.screen.blit(left_value, (left_bar_rect.right + 10, 172))
-        
-        right_label = self.font_small.render("Right Motor (High Freq)", True, TEXT_COLOR)
-        self.screen.blit(right_label, (self.vis_rect.x + 20, 230))
+            # Blit the matching slice of a cached full-width bar instead of
+            # rasterizing a rounded rect at the current fill width.
+            fill = panel_surface(left_bar_rect.size, ACTIVE_COLOR, radius=5)
+            self.screen.blit(fill, left_bar_rect,
+                             area=pygame.Rect(0, 0, int(270 * self.current_left / 255), 40))
+        # The value strings only take 256 distinct forms, so they cache well.
+        self.screen.blit(render_text(self.font_small, f"{int(self.current_left)}", TEXT_COLOR),
+                         (left_bar_rect.right + 10, 172))
+
+        self.screen.blit(render_text(self.font_small, "Right Motor (High Freq)", TEXT_COLOR),
+                         (self.vis_rect.x + 20, 230))
         right_bar_rect = pygame.Rect(self.vis_rect.x + 20, 255, 270, 40)
-        pygame.draw.rect(self.screen, SLIDER_COLOR, right_bar_rect, border_radius=5)
+        self.screen.blit(panel_surface(right_bar_rect.size, SLIDER_COLOR, radius=5), right_bar_rect)
         if self.current_right > 0:
-            right_fill = pygame.Rect(right_bar_rect.x, 255, int(270 * self.current_right / 255), 40)
-            pygame.draw.rect(self.screen, (100, 200, 255), right_fill, border_radius=5)
-        right_value = self.font_small.render(f"{int(self.current_right)}", True, TEXT_COLOR)
-        self.screen.blit(right_value, (right_bar_rect.right + 10, 262))
+            fill = panel_surface(right_bar_rect.size, (100, 200, 255), radius=5)
+            self.screen.blit(fill, right_bar_rect,
+                             area=pygame.Rect(0, 0, int(270 * self.current_right / 255), 40))
+        self.screen.blit(render_text(self.font_small, f"{int(self.current_right)}", TEXT_COLOR),
+                         (right_bar_rect.right + 10, 262))
         
         if self.session_active and self.pattern_gen and self.config['mode'] == 'stochastic':
             info_y = 320
             phase_text = f"Phase: {self.pattern_gen.current_phase.upper()}"
-            self.screen.blit(self.font_small.render(phase_text, True, TEXT_COLOR), (self.vis_rect.x + 20, info_y))
+            self.screen.blit(render_text(self.font_small, phase_text, TEXT_COLOR), (self.vis_rect.x + 20, info_y))
             motor_text = f"Active: {self.pattern_gen.next_motor.upper() if self.pattern_gen.next_motor else 'None'}"
-            self.screen.blit(self.font_small.render(motor_text, True, TEXT_COLOR), (self.vis_rect.x + 20, info_y + 25))
+            self.screen.blit(render_text(self.font_small, motor_text, TEXT_COLOR), (self.vis_rect.x + 20, info_y + 25))
             if self.pattern_gen.resonance_mode:
                 res_text = f"Resonance: {self.pattern_gen.resonance_mode.replace('_', ' ').title()}"
-                self.screen.blit(self.font_small.render(res_text, True, ACCENT_COLOR), (self.vis_rect.x + 20, info_y + 50))
-            mult = self.pattern_gen.get_global_multiplier()
+                self.screen.blit(render_text(self.font_small, res_text, ACCENT_COLOR), (self.vis_rect.x + 20, info_y + 50))
+            mult = self.pattern_gen.global_multiplier
             mult_text = f"Intensity: {int(mult * 100)}%"
-            self.screen.blit(self.font_small.render(mult_text, True, TEXT_COLOR), (self.vis_rect.x + 20, info_y + 75))
+            self.screen.blit(render_text(self.font_small, mult_text, TEXT_COLOR), (self.vis_rect.x + 20, info_y + 75))
             progress = min(1.0, self.pattern_gen.current_time / self.config['peak_time']) if self.config['peak_time'] > 0 else 1.0
             prog_rect = pygame.Rect(self.vis_rect.x + 20, info_y + 110, 270, 20)
-            pygame.draw.rect(self.screen, SLIDER_COLOR, prog_rect, border_radius=3)
-            prog_fill = pygame.Rect(prog_rect.x, info_y + 110, int(270 * progress), 20)
-            pygame.draw.rect(self.screen, ACCENT_COLOR, prog_fill, border_radius=3)
-            self.screen.blit(self.font_small.render("Ramp Progress", True, TEXT_COLOR), (self.vis_rect.x + 20, info_y + 95))
-        
-        tips_y = self.vis_rect.bottom - 120
-        tips = ["Tips:", "• Use presets for quick starts", "• Hover over settings for tooltips", "• Take breaks every 10-15 min", "• Adjust intensity for comfort"]
-        for i, tip in enumerate(tips):
-            tip_surf = self.font_small.render(tip, True, TEXT_COLOR if i == 0 else (150, 150, 160))
-            self.screen.blit(tip_surf, (self.vis_rect.x + 20, tips_y + i * 20))
-    
-    def draw_sections(self):
-        """Draw configuration sections."""
-        for label, x, y in self.sections:
-            if label: # Don't draw title for empty-titled sections
-                text = self.font_small.render(label, True, ACCENT_COLOR)
-                self.screen.blit(text, (x, y))
-                # --- CHANGE: Removed the underline drawing call ---
-                # pygame.draw.line(self.screen, ACCENT_COLOR, (x, y + 22), (x + 450, y + 22), 1)
-                # --- END CHANGE ---
+            self.screen.blit(panel_surface(prog_rect.size, SLIDER_COLOR, radius=3), prog_rect)
+            if progress > 0:
+                fill = panel_surface(prog_rect.size, ACCENT_COLOR, radius=3)
+                self.screen.blit(fill, prog_rect,
+                                 area=pygame.Rect(0, 0, int(270 * progress), 20))
+            self.screen.blit(render_text(self.font_small, "Ramp Progress", TEXT_COLOR), (self.vis_rect.x + 20, info_y + 95))
+
+        self.screen.blits(self._tip_blits, doreturn=0)
     
     def on_mode_change(self):
         """Called when the mode dropdown is changed."""
@@ -1127,44 +1723,95 @@ class Wave2JoyGUI:
             self.sliders['session_length'].value = default_len
         self.update_config_from_ui()
 
-    def handle_events(self):
-        """Handle pygame events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+    def handle_events(self, first_event=None):
+        """Handle pygame events.
+
+        ``first_event`` is an event already popped from the queue (by the
+        idle ``event.wait`` in :meth:`run`); it is dispatched ahead of the
+        drained queue so event order is preserved.
+        """
+        last_motion = None
+        events = pygame.event.get()
+        if first_event is not None:
+            events.insert(0, first_event)
+        for event in events:
+            # Any queued event can change what is on screen; draw this frame.
+            self._needs_redraw = True
+            event_type = event.type
+            if event_type == pygame.QUIT:
                 self.running = False
                 return
 
+            if event_type == pygame.MOUSEMOTION:
+                # Motion arrives at mouse poll rate; every position is
+                # obsolete the moment a newer one exists, so keep only the
+                # final event and process it once after the drain.
+                last_motion = event
+                continue
+
+            if event_type == pygame.KEYDOWN:
+                # Keystrokes only ever affect the preset name input.
+                self.preset_name_input.handle_event(event)
+                continue
+
+            if event_type == pygame.WINDOWRESTORED or event_type == pygame.WINDOWEXPOSED:
+                # The OS invalidated the window contents (restore from
+                # minimize, uncover); the dirty-rect diff assumes the front
+                # buffer is intact, so force one full flip.
+                self._full_redraw = True
+                continue
+
+            if event_type == pygame.MOUSEBUTTONUP:
+                # Releases only matter to sliders, which use them to end a
+                # drag; no other widget reacts to button-up.
+                for slider in self._slider_list:
+                    slider.handle_event(event)
+                continue
+
             prev_mode_index = self.mode_dropdown.selected_index
             prev_preset_index = self.preset_dropdown.selected_index
 
-            ui_elements = [self.preset_dropdown, self.mode_dropdown, self.start_button, self.stop_button, 
-                           self.save_preset_button, self.delete_preset_button, self.preset_name_input] + list(self.sliders.values())
-
             event_handled = False
-            for element in ui_elements:
+            # Clicks walk the widgets in z-order (dropdowns render on top and
+            # come first) and stop at the first one that claims the event.
+            for element in self._ui_elements:
                 if element.handle_event(event):
                     event_handled = True
-                    break 
-            
+                    break
+
             if self.mode_dropdown.selected_index != prev_mode_index:
                 self.on_mode_change()
-            
+
             if self.preset_dropdown.selected_index != prev_preset_index:
                 current_preset = self.preset_dropdown.get_selected()
                 if current_preset != 'Custom':
                     self.apply_preset(current_preset)
-            
-            if event.type == pygame.MOUSEBUTTONDOWN and not event_handled:
+
+            if event_type == pygame.MOUSEBUTTONDOWN and not event_handled:
                 if self.preset_dropdown.expanded: self.preset_dropdown.expanded = False
-        
+
+        if last_motion is not None:
+            # Motion only affects button hover state and a dragging slider,
+            # so it skips the widget dispatch walk entirely.
+            pos = last_motion.pos
+            for button in self._buttons:
+                if button.enabled:
+                    button.hovered = button.rect.collidepoint(pos)
+            for slider in self._slider_list:
+                if slider.dragging:
+                    slider.handle_event(last_motion)
+        
+        # The labels never move, so a stationary cursor cannot change the
+        # hover result; rescan only when the mouse position did.
         mouse_pos = pygame.mouse.get_pos()
-        self.active_tooltip_text = None
-        
-        all_ui_elements = list(self.sliders.items()) + [('preset', self.preset_dropdown), ('mode', self.mode_dropdown)]
-        for key, element in all_ui_elements:
-            if element.label_rect and element.label_rect.collidepoint(mouse_pos):
-                self.active_tooltip_text = self.tooltips.get(key)
-                break
+        if mouse_pos != self._last_mouse_pos:
+            self._last_mouse_pos = mouse_pos
+            self.active_tooltip_text = None
+            if self._tooltip_bbox.collidepoint(mouse_pos):
+                for key, element in self._tooltip_targets:
+                    if element.label_rect and element.label_rect.collidepoint(mouse_pos):
+                        self.active_tooltip_text = self.tooltips.get(key)
+                        break
         
         # Enable/disable delete button based on selection
         selected_preset = self.preset_dropdown.get_selected()
@@ -1172,73 +1819,146 @@ class Wave2JoyGUI:
 
     def draw_tooltip(self):
         """Draws the active tooltip near the mouse cursor."""
-        if not self.active_tooltip_text:
+        text = self.active_tooltip_text
+        if not text:
+            self._tooltip_rect = None
             return
 
+        # Compose the box (panel, border, text lines) once per tooltip text;
+        # after that each frame is just positioning plus one blit.
+        box = self._tooltip_cache.get(text)
+        if box is None:
+            surfaces = [render_text(self.font_small, line, TEXT_COLOR)
+                        for line in text.split('\n')]
+            max_width = max(s.get_width() for s in surfaces)
+            total_height = sum(s.get_height() for s in surfaces)
+            padding = 8
+            # Copy the shared panel so the text isn't baked into the cache
+            # entry other widgets blit from.
+            box = panel_surface((max_width + padding * 2, total_height + padding * 2),
+                                PANEL_COLOR, ACCENT_COLOR, 1, 4).copy()
+            current_y = padding
+            for surf in surfaces:
+                box.blit(surf, (padding, current_y))
+                current_y += surf.get_height()
+            self._tooltip_cache[text] = box
+
         mouse_pos = pygame.mouse.get_pos()
-        lines = self.active_tooltip_text.split('\n')
-        
-        surfaces = [self.font_small.render(line, True, TEXT_COLOR) for line in lines]
-        
-        max_width = max(s.get_width() for s in surfaces)
-        total_height = sum(s.get_height() for s in surfaces)
-        
-        padding = 8
-        box_rect = pygame.Rect(0, 0, max_width + padding * 2, total_height + padding * 2)
-        
-        box_rect.topleft = (mouse_pos[0] + 15, mouse_pos[1] + 10)
+        box_rect = box.get_rect(topleft=(mouse_pos[0] + 15, mouse_pos[1] + 10))
         if box_rect.right > WINDOW_WIDTH:
             box_rect.right = mouse_pos[0] - 15
         if box_rect.bottom > WINDOW_HEIGHT:
             box_rect.bottom = mouse_pos[1] - 10
-            
-        pygame.draw.rect(self.screen, PANEL_COLOR, box_rect, border_radius=4)
-        pygame.draw.rect(self.screen, ACCENT_COLOR, box_rect, 1, border_radius=4)
-        
-        current_y = box_rect.y + padding
-        for surf in surfaces:
-            self.screen.blit(surf, (box_rect.x + padding, current_y))
-            current_y += surf.get_height()
+
+        self.screen.blit(box, box_rect)
+        self._tooltip_rect = box_rect
 
     def draw(self):
-        """Draw all UI elements."""
-        self.screen.fill(BG_COLOR)
-        
+        """Draw all UI elements, pushing only the dynamic regions to screen."""
+        self.screen.blit(self._static_bg, (0, 0))
+
         self.draw_header()
-        self.draw_sections()
-        
-        for slider in self.sliders.values():
+
+        for slider in self._slider_list:
             slider.draw(self.screen, self.font_small)
-        
-        # Draw static preset UI first
-        preset_name_label = self.font_small.render("Preset Name:", True, TEXT_COLOR)
-        self.screen.blit(preset_name_label, (20, 130))
+
         self.preset_name_input.draw(self.screen)
         self.save_preset_button.draw(self.screen, self.font_small)
         self.delete_preset_button.draw(self.screen, self.font_small)
-        
+
         # Draw dropdowns after other UI to ensure they render on top
         self.preset_dropdown.draw(self.screen, self.font_small)
         self.mode_dropdown.draw(self.screen, self.font_small)
-        
+
         self.start_button.draw(self.screen, self.font_medium)
         self.stop_button.draw(self.screen, self.font_medium)
-        
+
         self.draw_visualizer()
-        
+
         self.draw_tooltip()
-        
-        pygame.display.flip()
+
+        # Diff each dynamic region's state against the previous frame and
+        # push only the ones that changed.
+        dirty = []
+        states = self._region_states
+        for slider, rect in self._slider_regions:
+            if states.get(slider) != slider.value:
+                states[slider] = slider.value
+                dirty.append(rect)
+        for button, rect in self._button_regions:
+            state = (button.hovered, button.enabled)
+            if states.get(button) != state:
+                states[button] = state
+                dirty.append(rect)
+        inp = self.preset_name_input
+        state = (inp.text, inp.active, inp.cursor_visible)
+        if states.get(inp) != state:
+            states[inp] = state
+            dirty.append(inp.rect)
+        if states.get('status') != self.controller_connected:
+            states['status'] = self.controller_connected
+            dirty.append(self._status_rect)
+        # The visualizer and timer only need an upload when a value they
+        # display changes; constant modes and stochastic gaps produce long
+        # runs of identical frames that can skip the push.
+        if self.session_active:
+            vis_state = (int(self.current_left), int(self.current_right))
+            gen = getattr(self, 'pattern_gen', None)
+            if gen and self.config['mode'] == 'stochastic':
+                peak = self.config['peak_time']
+                progress = min(1.0, gen.current_time / peak) if peak > 0 else 1.0
+                vis_state += (gen.current_phase, gen.next_motor, gen.resonance_mode,
+                              int(gen.global_multiplier * 100), int(270 * progress))
+            timer_state = int(time.perf_counter() - self.session_start_time)
+        else:
+            vis_state = timer_state = False
+        if states.get('vis') != vis_state:
+            states['vis'] = vis_state
+            dirty.append(self._vis_area)
+        if states.get('timer') != timer_state:
+            states['timer'] = timer_state
+            dirty.append(self._timer_rect)
+
+        # Dropdown lists and the tooltip move around, so their current rects
+        # (and last frame's, to erase them) join the changed regions.
+        extra = [self._dropdown_area(self.preset_dropdown),
+                 self._dropdown_area(self.mode_dropdown)]
+        if self._tooltip_rect:
+            extra.append(self._tooltip_rect)
+
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            pygame.display.update(dirty + extra + self._prev_extra_rects)
+        self._prev_extra_rects = extra
     
     def run(self):
         """Main application loop."""
         while self.running:
-            self.handle_events()
-            
+            # With no session running and no text cursor blinking there is
+            # nothing to animate, so block on the OS until an event arrives
+            # (or 100 ms passes) instead of spinning at 60 FPS.  The waited
+            # event is handed straight to the dispatcher: re-posting it would
+            # append it to the tail of the queue, reordering it behind any
+            # events that arrived while we slept.
+            waited_event = None
+            if not self.session_active and not self.preset_name_input.active:
+                event = pygame.event.wait(100)
+                if event.type != pygame.NOEVENT:
+                    waited_event = event
+
+            self.handle_events(waited_event)
+
             if self.session_completed_flag:
                 self._handle_session_end()
+                self._needs_redraw = True
 
-            self.draw()
+            # With no events, no session, and no blinking cursor, the screen
+            # cannot have changed; skip the draw pass entirely.
+            if self.session_active or self._needs_redraw or self.preset_name_input.active:
+                self.draw()
+                self._needs_redraw = False
             self.clock.tick(60)
         
         self.session_active = False